@@ -23,11 +23,19 @@ def get_gdp_data():
 
     # Instead of a CSV on disk, you could read from an HTTP endpoint here too.
     DATA_FILENAME = Path(__file__).parent/'data/gdp_data.csv'
-    raw_gdp_df = pd.read_csv(DATA_FILENAME)
 
     MIN_YEAR = 1960
     MAX_YEAR = 2022
 
+    YEAR_COLUMNS = [str(x) for x in range(MIN_YEAR, MAX_YEAR + 1)]
+
+    # Only parse the columns we actually use, so the name/indicator columns
+    # (and the empty trailing column) are skipped by the CSV reader.
+    raw_gdp_df = pd.read_csv(
+        DATA_FILENAME,
+        usecols=['Country Code', *YEAR_COLUMNS],
+    )
+
     # The data above has columns like:
     # - Country Name
     # - Country Code
@@ -47,7 +55,7 @@ def get_gdp_data():
     # So let's pivot all those year-columns into two: Year and GDP
     gdp_df = raw_gdp_df.melt(
         ['Country Code'],
-        [str(x) for x in range(MIN_YEAR, MAX_YEAR + 1)],
+        YEAR_COLUMNS,
         'Year',
         'GDP',
     )
@@ -55,6 +63,8 @@ def get_gdp_data():
     # Convert years from string to integers
     gdp_df['Year'] = pd.to_numeric(gdp_df['Year'])
 
+    # melt() stacks the year-columns one after the other, so rows are already
+    # ordered by year. The page relies on this to slice year ranges quickly.
     return gdp_df
 
 gdp_df = get_gdp_data()
@@ -98,11 +108,14 @@ selected_countries = st.multiselect(
 ''
 ''
 
-# Filter the data
-filtered_gdp_df = gdp_df[
-    (gdp_df['Country Code'].isin(selected_countries))
-    & (gdp_df['Year'] <= to_year)
-    & (from_year <= gdp_df['Year'])
+# Filter the data. Rows are sorted by year (see get_gdp_data), so the year
+# range is a contiguous slice we can find with a binary search.
+start = gdp_df['Year'].searchsorted(from_year, side='left')
+end = gdp_df['Year'].searchsorted(to_year, side='right')
+years_gdp_df = gdp_df.iloc[start:end]
+
+filtered_gdp_df = years_gdp_df[
+    years_gdp_df['Country Code'].isin(selected_countries)
 ]
 
 st.header('GDP over time', divider='gray')
@@ -120,27 +133,33 @@ st.line_chart(
 ''
 
 
-first_year = gdp_df[gdp_df['Year'] == from_year]
-last_year = gdp_df[gdp_df['Year'] == to_year]
+first_year = gdp_df.iloc[start:gdp_df['Year'].searchsorted(from_year, side='right')]
+last_year = gdp_df.iloc[gdp_df['Year'].searchsorted(to_year, side='left'):end]
 
 st.header(f'GDP in {to_year}', divider='gray')
 
 ''
 
+# Look up every selected country at once, rather than filtering the
+# first/last year rows separately for each country.
+first_gdps = first_year.set_index('Country Code')['GDP'].reindex(selected_countries) / 1000000000
+last_gdps = last_year.set_index('Country Code')['GDP'].reindex(selected_countries) / 1000000000
+growths = last_gdps / first_gdps
+
 cols = st.columns(4)
 
 for i, country in enumerate(selected_countries):
     col = cols[i % len(cols)]
 
     with col:
-        first_gdp = first_year[first_year['Country Code'] == country]['GDP'].iat[0] / 1000000000
-        last_gdp = last_year[last_year['Country Code'] == country]['GDP'].iat[0] / 1000000000
+        first_gdp = first_gdps[country]
+        last_gdp = last_gdps[country]
 
         if math.isnan(first_gdp):
             growth = 'n/a'
             delta_color = 'off'
         else:
-            growth = f'{last_gdp / first_gdp:,.2f}x'
+            growth = f'{growths[country]:,.2f}x'
             delta_color = 'normal'
 
         st.metric(